@@ -26,6 +26,8 @@ from . import config
 import logging
 
 import numpy as np
+# needed for the eval'ed np.lib.recfunctions.append_fields in avg_N_bin_scans
+import numpy.lib.recfunctions  # noqa: F401
 import collections
 import matplotlib.pyplot as plt
 import matplotlib as mpl
@@ -150,19 +152,19 @@ class Evaluation(object):
         source_counters = []
         col_string = col_name
 
-        for find_cdef in self.cdef.keys():
-            # check for all predefined counters
+        for find_cdef, cdef_string in self.cdef.items():
+            # check for all predefined counters and replace the counter
+            # definition in the string in a single pass
             search_pattern = r'\b' + find_cdef + r'\b'
-            if re.search(search_pattern, col_string) is not None:
-                if self.cdef[find_cdef] in source_cols:
+            (col_string, num_subs) = re.subn(search_pattern,
+                                             '(' + cdef_string + ')', col_string)
+            if num_subs > 0:
+                if cdef_string in source_cols:
                     # this counter definition is a base source counter
-                    source_counters.append(self.cdef[find_cdef])
+                    source_counters.append(cdef_string)
                 # found a predefined counter
                 # recursive call if predefined counter must be resolved again
                 recall = True
-                # replace the counter definition in the string
-                (col_string, _) = re.subn(search_pattern,
-                                          '(' + self.cdef[find_cdef] + ')', col_string)
 
         if recall:
             # do the recursive call
@@ -257,10 +259,10 @@ class Evaluation(object):
         data_list = []
         dtype_list = []
         for name in data.dtype.names:
-            data_list.append(data[name][res])
-            dtype_list.append((name,
-                               data[name][res].dtype,
-                               data[name][res].shape))
+            # apply the boolean index only once per column
+            filtered = data[name][res]
+            data_list.append(filtered)
+            dtype_list.append((name, filtered.dtype, filtered.shape))
         return np.core.records.fromarrays(data_list, dtype=dtype_list)
 
     def get_scan_data(self, scan_num):
@@ -329,7 +331,7 @@ class Evaluation(object):
             clist.append(self.xcol)
 
         source_cols = []
-        concat_data = np.array([])
+        concat_list = []
 
         data_list = self.get_scan_list_data(scan_list)
 
@@ -390,16 +392,17 @@ class Evaluation(object):
                                 + col_name + '\',data=(' + eval_string
                                 + '), dtypes=float, asrecarray=True, usemask=True)')
 
-            if i > 0:
-                # this is not the first scan in the list so append the data to
-                # the concatenated data array
-                concat_data = np.concatenate((concat_data, data), axis=0)
-            else:
-                concat_data = data
+            # collect the data of all scans to concatenate them only once
+            concat_list.append(data)
 
-                if len(xgrid) == 0:
-                    # if no xgrid is given we use the xData of the first scan instead
-                    xgrid = concat_data[self.xcol]
+            if (i == 0) and (len(xgrid) == 0):
+                # if no xgrid is given we use the xData of the first scan instead
+                xgrid = data[self.xcol]
+
+        if len(concat_list) > 1:
+            concat_data = np.concatenate(concat_list, axis=0)
+        else:
+            concat_data = concat_list[0]
 
         # remove xcol from clist and resolved counters for further treatment
         del resolved_counters[clist.index(self.xcol)]
@@ -641,7 +644,6 @@ class Evaluation(object):
         """
 
         from matplotlib.mlab import griddata
-        from matplotlib import gridspec
 
         # read data from spec file
         try:
@@ -674,16 +676,16 @@ class Evaluation(object):
         if not skip_plot:
 
             if cbar:
-                gs = gridspec.GridSpec(4, 2,
-                                       width_ratios=[3, 1],
-                                       height_ratios=[0.2, 0.1, 1, 3]
-                                       )
+                gs = mpl.gridspec.GridSpec(4, 2,
+                                           width_ratios=[3, 1],
+                                           height_ratios=[0.2, 0.1, 1, 3]
+                                           )
                 k = 4
             else:
-                gs = gridspec.GridSpec(2, 2,
-                                       width_ratios=[3, 1],
-                                       height_ratios=[1, 3]
-                                       )
+                gs = mpl.gridspec.GridSpec(2, 2,
+                                           width_ratios=[3, 1],
+                                           height_ratios=[1, 3]
+                                           )
                 k = 0
 
             ax1 = plt.subplot(gs[0+k])
@@ -102,59 +102,68 @@ class PalH5(Source):
             self.log.error('File path does not exist!')
             return
 
-        for root, subdirectories, files in os.walk(self.file_path):
-            for sub_dir in sorted(subdirectories):
-                # check for scan number in given range
-                try:
-                    scan_number = int(sub_dir)
-                except ValueError:
-                    self.log.exception('{:s} is no scan folder - skipping'.format(sub_dir))
-                    continue
-
-                if (scan_number >= self.start_scan_number) and \
-                        ((scan_number <= self.stop_scan_number) or
-                            (self.stop_scan_number == -1)):
-                    last_scan_number = self.get_last_scan_number()
-                    # check if Scan needs to be re-created
-                    # if scan is not present, its the last one, or force overwrite
-                    if (scan_number not in self.scan_dict.keys()) or \
-                            (scan_number >= last_scan_number) or \
-                            self.force_overwrite:
-                        # create scan object
-
-                        h5_file = os.path.join(self.file_path,
-                                               self.file_name.format(scan_number),
-                                               self.file_name.format(scan_number) + '.h5')
-
-                        try:
-                            with h5py.File(h5_file, 'r') as h5:
-                                header = h5['R{0:04d}/header'.format(scan_number)]
-
-                                init_motor_pos = {}
-                                for key in header['motor_init_pos'].keys():
-                                    init_motor_pos[key] = \
-                                        header['motor_init_pos/{:s}'.format(key)][()]
-
-                                # create scan object
-                                try:
-                                    # this is a fixQ fix
-                                    int_time = float(header['scan_cmd'].asstr()[()].split(' ')[-1])
-                                except ValueError:
-                                    int_time = float(header['scan_cmd'].asstr()[()].split(' ')[-2])
-                                scan = Scan(int(scan_number),
-                                            cmd=header['scan_cmd'].asstr()[()],
-                                            date=header['time'].asstr()[()].split(' ')[0],
-                                            time=header['time'].asstr()[()].split(' ')[1],
-                                            int_time=int_time,
-                                            header='',
-                                            init_mopo=init_motor_pos)
-                                self.scan_dict[scan_number] = scan
-                            # check if the data needs to be read as well
-                            if self.read_all_data:
-                                self.read_scan_data(self.scan_dict[scan_number])
-                        except OSError:
-                            self.log.warning('Could not open file {:s}'.format(h5_file))
-                            continue
+        # list the scan folders only once without descending into them
+        try:
+            with os.scandir(self.file_path) as entries:
+                sub_dirs = sorted(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            self.log.error('File path could not be read!')
+            return
+
+        for sub_dir in sub_dirs:
+            # check for scan number in given range
+            try:
+                scan_number = int(sub_dir)
+            except ValueError:
+                self.log.exception('{:s} is no scan folder - skipping'.format(sub_dir))
+                continue
+
+            if (scan_number >= self.start_scan_number) and \
+                    ((scan_number <= self.stop_scan_number) or
+                        (self.stop_scan_number == -1)):
+                last_scan_number = self.get_last_scan_number()
+                # check if Scan needs to be re-created
+                # if scan is not present, its the last one, or force overwrite
+                if (scan_number not in self.scan_dict.keys()) or \
+                        (scan_number >= last_scan_number) or \
+                        self.force_overwrite:
+                    # create scan object
+
+                    h5_file = self.get_h5_file_path(scan_number)
+
+                    try:
+                        with h5py.File(h5_file, 'r') as h5:
+                            header = h5['R{0:04d}/header'.format(scan_number)]
+
+                            init_motor_pos = {}
+                            for key in header['motor_init_pos'].keys():
+                                init_motor_pos[key] = \
+                                    header['motor_init_pos/{:s}'.format(key)][()]
+
+                            # read and split the strings only once
+                            scan_cmd = header['scan_cmd'].asstr()[()]
+                            scan_cmd_list = scan_cmd.split()
+                            date_time_list = header['time'].asstr()[()].split(' ')
+                            # create scan object
+                            try:
+                                # this is a fixQ fix
+                                int_time = float(scan_cmd_list[-1])
+                            except ValueError:
+                                int_time = float(scan_cmd_list[-2])
+                            scan = Scan(int(scan_number),
+                                        cmd=scan_cmd,
+                                        date=date_time_list[0],
+                                        time=date_time_list[1],
+                                        int_time=int_time,
+                                        header='',
+                                        init_mopo=init_motor_pos)
+                            self.scan_dict[scan_number] = scan
+                        # check if the data needs to be read as well
+                        if self.read_all_data:
+                            self.read_scan_data(self.scan_dict[scan_number])
+                    except OSError:
+                        self.log.warning('Could not open file {:s}'.format(h5_file))
+                        continue
 
     def read_raw_scan_data(self, scan):
         """read_raw_scan_data
@@ -167,22 +176,35 @@ class PalH5(Source):
         """
         self.log.info('read_raw_scan_data for scan #{:d}'.format(scan.number))
         # try to open the file
-        h5_file = os.path.join(self.file_path,
-                               self.file_name.format(scan.number),
-                               self.file_name.format(scan.number) + '.h5')
+        h5_file = self.get_h5_file_path(scan.number)
 
         with h5py.File(h5_file, 'r') as h5:
-            entry = h5['R{0:04d}'.format(scan.number)]
+            scan_dat = h5['R{0:04d}/scan_dat'.format(scan.number)]
             # iterate through data fields
             data_list = []
             dtype_list = []
-            for key in entry['scan_dat'].keys():
+            for key, dataset in scan_dat.items():
                 if '_raw' not in key:
-                    data_list.append(entry['scan_dat'][key])
-                    dtype_list.append((key,
-                                      entry['scan_dat'][key].dtype,
-                                      entry['scan_dat'][key].shape))
+                    # read the full dataset at once
+                    data = dataset[()]
+                    data_list.append(data)
+                    dtype_list.append((key, data.dtype, data.shape))
             if len(data_list) > 0:
                 scan.data = fromarrays(data_list, dtype=dtype_list)
             else:
                 scan.data = None
+
+    def get_h5_file_path(self, scan_number):
+        """get_h5_file_path
+
+        Return the path to the h5 file of a given scan number.
+
+        Args:
+            scan_number (uint): number of the scan.
+
+        Returns:
+            h5_file (str): path to the h5 file.
+
+        """
+        scan_name = self.file_name.format(scan_number)
+        return os.path.join(self.file_path, scan_name, scan_name + '.h5')
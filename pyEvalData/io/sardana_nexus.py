@@ -104,8 +104,10 @@ class SardanaNeXus(Source):
 
         with nxs_file.nxfile:
             for entry in nxs_file:
+                # resolve the entry only once
+                nxs_entry = nxs_file[entry]
                 # check for scan number in given range
-                entry_number = int(nxs_file[entry].entry_identifier)
+                entry_number = int(nxs_entry.entry_identifier)
                 if (entry_number >= self.start_scan_number) and \
                         ((entry_number <= self.stop_scan_number) or
                             (self.stop_scan_number == -1)):
@@ -117,14 +119,14 @@ class SardanaNeXus(Source):
                             self.force_overwrite:
                         # create scan object
                         init_mopo = {}
-                        for field in nxs_file[entry].measurement.pre_scan_snapshot:
+                        for field in nxs_entry.measurement.pre_scan_snapshot:
                             init_mopo[field] = \
-                                nxs_file[entry]['measurement/pre_scan_snapshot'][field]
+                                nxs_entry['measurement/pre_scan_snapshot'][field]
 
                         scan = Scan(int(entry_number),
-                                    cmd=nxs_file[entry].title,
-                                    date=nxs_file[entry].start_time,
-                                    time=nxs_file[entry].start_time,
+                                    cmd=nxs_entry.title,
+                                    date=nxs_entry.start_time,
+                                    time=nxs_entry.start_time,
                                     int_time=float(0),
                                     header='',
                                     init_mopo=init_mopo)
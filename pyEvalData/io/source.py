@@ -28,6 +28,7 @@ import logging
 from .scan import Scan
 
 import os.path as path
+import numpy as np
 from numpy.core.records import fromarrays
 import nexusformat.nexus as nxs
 
@@ -145,17 +146,18 @@ class Source(object):
         for the included scan.
 
         Attributes:
-            scan_number_list (list[int]): explicit list of scans
+            scan_number_list (list[int]|ndarray[int]|int): explicit list of scans
 
         """
 
-        if not isinstance(scan_number_list, list):
-            scan_number_list = [int(scan_number_list)]
+        # accept single numbers as well as lists, ranges, and arrays
+        scan_number_list = [int(scan_number) for scan_number
+                            in np.atleast_1d(scan_number_list)]
 
         last_scan_number = self.get_last_scan_number()
         if (len(scan_number_list) == 0) \
                 or (last_scan_number in scan_number_list) \
-                or any(list(set(scan_number_list) - set(self.scan_dict.keys()))):
+                or (len(set(scan_number_list) - self.scan_dict.keys()) > 0):
 
             self.log.info('Update source')
 
@@ -207,32 +209,35 @@ class Source(object):
 
         with nxs_file.nxfile:
             for entry in nxs_file:
+                # resolve the entry only once
+                nxs_entry = nxs_file[entry]
+                scan_number = nxs_entry.number
                 # check for scan number in given range
-                if (nxs_file[entry].number >= self.start_scan_number) and \
-                        ((nxs_file[entry].number <= self.stop_scan_number) or
+                if (scan_number >= self.start_scan_number) and \
+                        ((scan_number <= self.stop_scan_number) or
                             (self.stop_scan_number == -1)):
                     last_scan_number = self.get_last_scan_number()
                     # check if Scan needs to be re-created
                     # if scan is not present, its the last one, or force overwrite
-                    if (nxs_file[entry].number not in self.scan_dict.keys()) or \
-                            (nxs_file[entry].number >= last_scan_number) or \
+                    if (scan_number not in self.scan_dict.keys()) or \
+                            (scan_number >= last_scan_number) or \
                             self.force_overwrite:
                         # create scan object
                         init_mopo = {}
-                        for field in nxs_file[entry].init_mopo:
-                            init_mopo[field] = nxs_file[entry]['init_mopo'][field]
-
-                        scan = Scan(int(nxs_file[entry].number),
-                                    cmd=nxs_file[entry].cmd,
-                                    date=nxs_file[entry].date,
-                                    time=nxs_file[entry].time,
-                                    int_time=float(nxs_file[entry].int_time),
-                                    header=nxs_file[entry].header,
+                        for field in nxs_entry.init_mopo:
+                            init_mopo[field] = nxs_entry['init_mopo'][field]
+
+                        scan = Scan(int(scan_number),
+                                    cmd=nxs_entry.cmd,
+                                    date=nxs_entry.date,
+                                    time=nxs_entry.time,
+                                    int_time=float(nxs_entry.int_time),
+                                    header=nxs_entry.header,
                                     init_mopo=init_mopo)
-                        self.scan_dict[nxs_file[entry].number] = scan
+                        self.scan_dict[scan_number] = scan
                         # check if the data needs to be read as well
                         if self.read_all_data:
-                            self.read_scan_data(self.scan_dict[nxs_file[entry].number])
+                            self.read_scan_data(self.scan_dict[scan_number])
 
     def check_nexus_file_exists(self):
         """check_nexus_file_exists
@@ -252,10 +257,7 @@ class Source(object):
         If the `scan_dict` is empty return 0.
 
         """
-        try:
-            return sorted(self.scan_dict.keys())[-1]
-        except IndexError:
-            return 0
+        return max(self.scan_dict.keys(), default=0)
 
     def get_all_scan_numbers(self):
         """get_all_scan_numbers
@@ -313,16 +315,32 @@ class Source(object):
         """
         self.log.debug('get_scan_list')
 
+        return list(self.iter_scan_list(scan_number_list, read_data))
+
+    def iter_scan_list(self, scan_number_list, read_data=True):
+        """iter_scan_list
+
+        Yields the scan objects from the `scan_dict` determined by
+        the list of scan_number one after another.
+        In contrast to :meth:`get_scan_list` the data of each scan
+        is only read when the scan is requested.
+
+        Args:
+            scan_number_list (list(uint)): list of numbers of the scan.
+            read_data (bool, optional): read data from source.
+              Defaults to `True`.
+
+        Yields:
+            scan (Scan): scan object.
+
+        """
+        self.log.debug('iter_scan_list')
+
         if self.update_before_read:
             self.update(scan_number_list)
 
-        scans = []
         for scan_number in scan_number_list:
-            scan = self.get_scan(scan_number, read_data, dismiss_update=True)
-
-            scans.append(scan)
-
-        return scans
+            yield self.get_scan(scan_number, read_data, dismiss_update=True)
 
     def get_scan_data(self, scan_number):
         """get_scan_data
@@ -368,7 +386,8 @@ class Source(object):
 
         data_list = []
         meta_list = []
-        for scan in self.get_scan_list(scan_number_list):
+        # read one scan at a time to forget its data before reading the next one
+        for scan in self.iter_scan_list(scan_number_list):
             data_list.append(scan.data.copy())
             meta_list.append(scan.meta.copy())
             if self.read_and_forget:
@@ -537,10 +556,8 @@ class Source(object):
         """
         self.log.info('save_all_scans_to_nexus')
         nxs_file = self.get_nexus_file()
-        try:
-            last_scan_in_nexus = sorted(int(num.strip('entry')) for num in nxs_file.keys())[-1]
-        except IndexError:
-            last_scan_in_nexus = -1
+        last_scan_in_nexus = max((int(num.strip('entry')) for num in nxs_file.keys()),
+                                 default=-1)
 
         for scan_number, scan in self.scan_dict.items():
             entry_name = 'entry{:d}'.format(scan.number)
@@ -567,11 +584,12 @@ class Source(object):
 
         """
         self.log.debug('get_nexus_file')
+        nxs_file_path = path.join(self.nexus_file_path, self.nexus_file_name)
         try:
-            nxs_file = nxs.nxload(path.join(self.nexus_file_path, self.nexus_file_name), mode='rw')
+            nxs_file = nxs.nxload(nxs_file_path, mode='rw')
         except nxs.NeXusError:
-            nxs.NXroot().save(path.join(self.nexus_file_path, self.nexus_file_name))
-            nxs_file = nxs.nxload(path.join(self.nexus_file_path, self.nexus_file_name), mode='rw')
+            nxs.NXroot().save(nxs_file_path)
+            nxs_file = nxs.nxload(nxs_file_path, mode='rw')
         return nxs_file
 
     @property
@@ -94,7 +94,7 @@ class Spec(Source):
         """
         self.log.info('parse_raw')
 
-        if ('spec_file' not in dir(self)) or self.force_overwrite:
+        if (getattr(self, 'spec_file', None) is None) or self.force_overwrite:
             self.log.info('Create spec_file from xrayutilities')
             self.spec_file = xu.io.SPECFile(self.file_name,
                                             path=self.file_path)
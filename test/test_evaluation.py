@@ -19,3 +19,15 @@ def test_evaluation(evaluation):
     assert data1['delay'][0] == pytest.approx(-0.998557475)
     y, x, yerr, xerr, name = data.plot_scans([1])
     assert y[data.clist[0]][0] == pytest.approx(0.02183873769)
+
+
+@pytest.mark.parametrize('source_cols',
+                         [
+                          ['Two', 'Two Theta'],
+                          ['Two Theta', 'Two'],
+                         ])
+def test_resolve_counter_name_overlapping(evaluation, source_cols):
+    col_string, source_counters = evaluation.resolve_counter_name('B/Two Theta',
+                                                                  source_cols)
+    assert col_string == 'B/Two Theta'
+    assert sorted(source_counters) == ['Two', 'Two Theta']
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import pytest
+import numpy as np
 
 
 @pytest.mark.parametrize('mysource, sname, scan_num, scan_delay',
@@ -14,3 +15,24 @@ def test_source(mysource, sname, scan_num, scan_delay, request):
     assert s.name == sname
     assert s.get_scan(scan_num).meta['number'] == scan_num
     assert s.get_scan(scan_num).data['delay'][0] == pytest.approx(scan_delay)
+
+
+@pytest.mark.parametrize('scan_number_list',
+                         [
+                          [0],
+                          np.int64(0),
+                          np.array([0, 0]),
+                          np.array([1, 1]),
+                         ])
+def test_update_scan_number_list(source_spec, scan_number_list, caplog):
+    # scan #0 is missing and scan #1 is the last scan, so both need an update
+    with caplog.at_level('INFO'):
+        source_spec.update(scan_number_list)
+    assert 'Update source' in caplog.messages
+
+
+def test_iter_scan_list(source_spec):
+    scans = source_spec.iter_scan_list([1])
+    assert next(scans).meta['number'] == 1
+    with pytest.raises(StopIteration):
+        next(scans)